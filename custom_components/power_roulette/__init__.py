@@ -4,20 +4,38 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.typing import ConfigType
 
+from .aggregate import PowerRouletteAggregateCoordinator
 from .api import PowerRouletteApiClient
-from .const import DOMAIN, PLATFORMS
+from .const import DATA_CLIENT, DATA_SCHEDULER, DATA_STABILITY, DOMAIN, KIND_AGGREGATE, KIND_SITE, PLATFORMS
 from .coordinator import PowerRouletteCoordinator
+from .scheduler import PowerRouletteRefreshScheduler
+from .stability import StabilityStore
+from .views import PowerRouletteScheduleView
 
 LOGGER = logging.getLogger(__name__)
 
 
+@callback
+def async_get_client(hass: HomeAssistant) -> PowerRouletteApiClient:
+  """Return the API client shared by all entries and config flows."""
+  if DATA_CLIENT not in hass.data:
+    hass.data[DATA_CLIENT] = PowerRouletteApiClient(async_get_clientsession(hass))
+  return hass.data[DATA_CLIENT]
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
   """Set up the integration via YAML (not supported)."""
+  hass.data[DATA_SCHEDULER] = PowerRouletteRefreshScheduler(hass)
+  stability_store = StabilityStore(hass)
+  await stability_store.async_load()
+  hass.data[DATA_STABILITY] = stability_store
+  hass.http.register_view(PowerRouletteScheduleView(hass))
   return True
 
 
@@ -25,14 +43,92 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
   """Set up Power Roulette from a config entry."""
   hass.data.setdefault(DOMAIN, {})
 
-  session = async_get_clientsession(hass)
-  client = PowerRouletteApiClient(session)
+  if entry.data.get("kind") == KIND_AGGREGATE:
+    return await _async_setup_aggregate_entry(hass, entry)
+
+  if entry.data.get("duplicate_of") and not entry.options:
+    # Collapsed onto another entry by the version 2 migration; that entry serves the source.
+    LOGGER.warning(
+        "%s duplicates another Power Roulette entry and is not loaded; remove it or change its queue",
+        entry.title,
+    )
+    entry.async_on_unload(entry.add_update_listener(_async_reload_entry))
+    return True
+
+  client = async_get_client(hass)
   city = entry.options.get("city", entry.data["city"])
   queue = entry.options.get("queue", entry.data["queue"])
 
-  coordinator = PowerRouletteCoordinator(hass, client, city, queue)
+  try:
+    provider = client.provider_key(city)
+  except ValueError:
+    LOGGER.error("%s: city %s is not supported by any provider; reconfigure or remove this entry", entry.title, city)
+    return False
+  source = client.source_key(city, queue)
+
+  scheduler: PowerRouletteRefreshScheduler = hass.data[DATA_SCHEDULER]
+  coordinator = PowerRouletteCoordinator(
+      hass,
+      client,
+      city,
+      queue,
+      scheduler.semaphore(provider),
+      hass.data[DATA_STABILITY],
+  )
+
+  # The first fetch is left to the scheduler so entries set up together are staggered.
+  entry.async_on_unload(scheduler.async_register(entry.entry_id, coordinator, source))
+
+  hass.data[DOMAIN][entry.entry_id] = {
+      "coordinator": coordinator,
+  }
+
+  await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+  # Aggregates hold a reference to the old coordinator; reload them to pick up this one.
+  _async_reload_dependent_aggregates(hass, entry.entry_id)
+  return True
+
 
-  await coordinator.async_config_entry_first_refresh()
+@callback
+def _async_reload_dependent_aggregates(hass: HomeAssistant, site_id: str) -> None:
+  """Reload loaded aggregates that combine the site ``site_id``."""
+  for other in hass.config_entries.async_entries(DOMAIN):
+    if (
+        other.data.get("kind") == KIND_AGGREGATE
+        and site_id
+        in {_resolve_site_id(hass, source_id) for source_id in other.options.get("entries", other.data.get("entries", []))}
+        and other.state is ConfigEntryState.LOADED
+    ):
+      hass.async_create_task(hass.config_entries.async_reload(other.entry_id))
+
+
+@callback
+def _resolve_site_id(hass: HomeAssistant, entry_id: str) -> str:
+  """Return the entry that actually serves ``entry_id`` (following migration duplicates)."""
+  entry = hass.config_entries.async_get_entry(entry_id)
+  if entry and entry.data.get("duplicate_of") and not entry.options:
+    return entry.data["duplicate_of"]
+  return entry_id
+
+
+async def _async_setup_aggregate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+  """Set up an aggregate over already loaded site entries."""
+  source_ids: list[str] = entry.options.get("entries", entry.data.get("entries", []))
+  sources = {}
+  for source_id in dict.fromkeys(_resolve_site_id(hass, source_id) for source_id in source_ids):
+    if hass.config_entries.async_get_entry(source_id) is None:
+      LOGGER.warning("Aggregate %s refers to removed entry %s; skipping it", entry.title, source_id)
+      continue
+    source = hass.data[DOMAIN].get(source_id)
+    if source is None:
+      raise ConfigEntryNotReady(f"Site entry {source_id} is not loaded yet")
+    sources[source_id] = source["coordinator"]
+
+  coordinator = PowerRouletteAggregateCoordinator(hass, sources)
+  coordinator.async_start()
+  entry.async_on_unload(coordinator.async_stop)
+  entry.async_on_unload(entry.add_update_listener(_async_reload_entry))
 
   hass.data[DOMAIN][entry.entry_id] = {
       "coordinator": coordinator,
@@ -42,11 +138,88 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
   return True
 
 
+async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+  """Reload an entry after its options changed."""
+  await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _site_unique_id(entry: ConfigEntry) -> str:
+  """Return the unique id a site entry has (or will have) after migration."""
+  city = entry.options.get("city", entry.data["city"])
+  queue = entry.options.get("queue", entry.data["queue"])
+  return f"{city.lower()}-{queue}"
+
+
+@callback
+def _migration_primary(hass: HomeAssistant, target: str) -> ConfigEntry:
+  """Pick the entry that keeps serving ``target`` when several resolve to it.
+
+  The candidate set and the choice do not change as entries migrate, so every entry
+  agrees on the primary whatever the migration order: the entry already holding the
+  target unique id wins, otherwise the oldest candidate.
+  """
+  candidates = [
+      entry
+      for entry in hass.config_entries.async_entries(DOMAIN)
+      if entry.data.get("kind") != KIND_AGGREGATE and _site_unique_id(entry) == target
+  ]
+  for entry in candidates:
+    if entry.unique_id == target:
+      return entry
+  return candidates[0]
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+  """Migrate old config entries."""
+  if entry.version > 2:
+    return False
+
+  if entry.version == 1:
+    if entry.data.get("kind") == KIND_AGGREGATE:
+      hass.config_entries.async_update_entry(entry, version=2)
+    else:
+      # Fold the options override into data: city/queue identify the shared data source.
+      city = entry.options.get("city", entry.data["city"])
+      queue = entry.options.get("queue", entry.data["queue"])
+      target = _site_unique_id(entry)
+      data = {"kind": KIND_SITE, "city": city, "queue": queue}
+      others = [other for other in hass.config_entries.async_entries(DOMAIN) if other.entry_id != entry.entry_id]
+      primary = _migration_primary(hass, target)
+      if primary.entry_id != entry.entry_id:
+        # Collapse onto the entry that keeps this city/queue; free our id for reuse.
+        LOGGER.warning("%s duplicates %s; collapsing it onto that entry", entry.title, primary.title)
+        data["duplicate_of"] = primary.entry_id
+        unique_id = f"{entry.unique_id}-dup-{entry.entry_id}"
+      elif any(other.unique_id == target for other in others):
+        # Another entry still holds the id from before it was re-pointed; keep ours.
+        unique_id = entry.unique_id
+      else:
+        unique_id = target
+      hass.config_entries.async_update_entry(
+          entry,
+          data=data,
+          options={},
+          unique_id=unique_id,
+          version=2,
+      )
+    LOGGER.debug("Migrated %s to version 2", entry.title)
+
+  return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
   """Unload a config entry."""
+  if entry.entry_id not in hass.data.get(DOMAIN, {}):
+    # Collapsed duplicate: nothing was set up.
+    return True
+
   unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
   if unload_ok:
     hass.data[DOMAIN].pop(entry.entry_id, None)
+    if entry.data.get("kind") != KIND_AGGREGATE:
+      # Stop aggregates from merging this site's frozen intervals; they wait for it
+      # to load again (or drop it if it was removed).
+      _async_reload_dependent_aggregates(hass, entry.entry_id)
 
   return unload_ok
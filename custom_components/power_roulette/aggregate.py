@@ -0,0 +1,186 @@
+"""Aggregate availability across several Power Roulette sites."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import PowerRouletteCoordinator
+
+LOGGER = logging.getLogger(__name__)
+
+
+def merge_outage_intervals(interval_sets: Sequence[Sequence[tuple[datetime, datetime]]]) -> list[tuple[datetime, int]]:
+  """Merge per-site outage intervals into a step timeline with one sweep-line pass.
+
+  Returns ``(boundary, sites_out)`` pairs sorted by time, where ``sites_out`` is the
+  number of sites without power from ``boundary`` until the next pair. Overlapping
+  intervals of the same site are counted once.
+  """
+  events: list[tuple[datetime, int, int]] = []
+  for site_idx, intervals in enumerate(interval_sets):
+    for start_dt, end_dt in intervals:
+      if end_dt <= start_dt:
+        continue
+      events.append((start_dt, 1, site_idx))
+      events.append((end_dt, -1, site_idx))
+  # Ends sort before starts at the same instant so back-to-back intervals do not double count.
+  events.sort(key=lambda event: (event[0], event[1]))
+
+  depth = [0] * len(interval_sets)
+  sites_out = 0
+  steps: list[tuple[datetime, int]] = []
+  for when, delta, site_idx in events:
+    before = depth[site_idx]
+    depth[site_idx] = before + delta
+    if before == 0 and delta > 0:
+      sites_out += 1
+    elif before == 1 and delta < 0:
+      sites_out -= 1
+    else:
+      continue
+
+    if steps and steps[-1][0] == when:
+      steps.pop()
+    if steps and steps[-1][1] == sites_out:
+      continue
+    if not steps and sites_out == 0:
+      continue
+    steps.append((when, sites_out))
+
+  return steps
+
+
+def aggregate_status(
+    steps: Sequence[tuple[datetime, int]], sites_total: int, now: datetime, sites_unknown: int = 0
+) -> dict[str, Any]:
+  """Evaluate a merged timeline of ``sites_total`` known sites at ``now``.
+
+  ``sites_unknown`` sites have no usable data; while any exist, ``any_powered`` and
+  ``all_powered`` are ``None`` unless the known sites already decide them.
+  """
+  times = [when for when, _ in steps]
+  idx = bisect_right(times, now) - 1
+  sites_out = steps[idx][1] if idx >= 0 else 0
+  known_any = sites_out < sites_total
+  known_all = sites_out == 0
+
+  next_any_change: datetime | None = None
+  next_all_change: datetime | None = None
+  for when, count in steps[idx + 1:]:
+    if next_any_change is None and (count < sites_total) != known_any:
+      next_any_change = when
+    if next_all_change is None and (count == 0) != known_all:
+      next_all_change = when
+    if next_any_change and next_all_change:
+      break
+
+  next_transition = steps[idx + 1][0] if idx + 1 < len(steps) else None
+
+  any_powered: bool | None = known_any
+  all_powered: bool | None = known_all
+  if sites_unknown:
+    # A known powered site settles "any"; a known unpowered site settles "all".
+    if not known_any:
+      any_powered = None
+    if known_all:
+      all_powered = None
+
+  return {
+      "sites_total": sites_total + sites_unknown,
+      "sites_unknown": sites_unknown,
+      "sites_without_power": sites_out,
+      "any_powered": any_powered,
+      "all_powered": all_powered,
+      "next_any_change": next_any_change.isoformat() if next_any_change else None,
+      "next_all_change": next_all_change.isoformat() if next_all_change else None,
+      "next_transition": next_transition.isoformat() if next_transition else None,
+  }
+
+
+def _has_data(source: PowerRouletteCoordinator) -> bool:
+  """Return True if a source's intervals are usable (fetched and not failing)."""
+  return source.data is not None and source.last_update_success
+
+
+class PowerRouletteAggregateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+  """Combine several site coordinators into one availability timeline.
+
+  The timeline is rebuilt only when a source coordinator refreshes; between refreshes
+  the state is re-evaluated by a timer armed at the next boundary instead of polling.
+  """
+
+  def __init__(self, hass: HomeAssistant, sources: dict[str, PowerRouletteCoordinator]) -> None:
+    """Initialize the aggregate coordinator."""
+    self.sources = sources
+    self._steps: list[tuple[datetime, int]] = []
+    self._sites_known = 0
+    self._unsub_sources: list[CALLBACK_TYPE] = []
+    self._unsub_boundary: CALLBACK_TYPE | None = None
+
+    super().__init__(
+        hass,
+        LOGGER,
+        name=f"{DOMAIN}_aggregate",
+        update_interval=None,
+    )
+
+  @callback
+  def async_start(self) -> None:
+    """Subscribe to the source coordinators and publish the initial state."""
+    for source in self.sources.values():
+      self._unsub_sources.append(source.async_add_listener(self._handle_source_update))
+    self._handle_source_update()
+
+  @callback
+  def async_stop(self) -> None:
+    """Drop source subscriptions and the pending boundary timer."""
+    for unsub in self._unsub_sources:
+      unsub()
+    self._unsub_sources.clear()
+    if self._unsub_boundary:
+      self._unsub_boundary()
+      self._unsub_boundary = None
+
+  async def _async_update_data(self) -> dict[str, Any]:
+    """Re-evaluate the cached timeline (no network access)."""
+    return self._evaluate(dt_util.utcnow())
+
+  @callback
+  def _handle_source_update(self) -> None:
+    """Rebuild the merged timeline after any source refresh."""
+    known = [source for source in self.sources.values() if _has_data(source)]
+    self._sites_known = len(known)
+    self._steps = merge_outage_intervals([source.intervals for source in known])
+    self._async_publish()
+
+  @callback
+  def _async_publish(self, _now: datetime | None = None) -> None:
+    """Push the state for the current instant and arm the next boundary timer."""
+    if self._unsub_boundary:
+      self._unsub_boundary()
+      self._unsub_boundary = None
+
+    data = self._evaluate(dt_util.utcnow())
+    self.async_set_updated_data(data)
+
+    next_transition = dt_util.parse_datetime(data["next_transition"]) if data["next_transition"] else None
+    if next_transition:
+      self._unsub_boundary = async_track_point_in_utc_time(self.hass, self._async_publish, next_transition)
+
+  def _evaluate(self, now: datetime) -> dict[str, Any]:
+    data = aggregate_status(self._steps, self._sites_known, now, len(self.sources) - self._sites_known)
+    data["sites"] = {
+        entry_id: {"city": source.city, "queue": str(source.queue), "known": _has_data(source)}
+        for entry_id, source in self.sources.items()
+    }
+    return data
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 from datetime import datetime
 import re
+import time
 from typing import Any, Protocol
 
 from aiohttp import ClientSession
@@ -18,6 +21,10 @@ IF_SCHEDULE_ENDPOINT = "/schedule-by-queue"
 # Lviv provider (placeholder; implement with real poweron.loe.lviv.ua endpoints)
 LVIV_BASE_URL = "https://poweron.loe.lviv.ua"
 
+# How long a fetched queue list / schedule is reused by the shared client.
+QUEUES_CACHE_TTL_SECONDS = 600
+SCHEDULE_CACHE_TTL_SECONDS = 60
+
 
 class Provider(Protocol):
   """Protocol for per-region providers."""
@@ -161,11 +168,19 @@ class LvivProvider:
 
 
 class PowerRouletteApiClient:
-  """API client that routes per-region provider."""
+  """API client that routes per-region provider.
+
+  One client is shared by all entries: schedules are cached and de-duplicated per
+  data source (provider + queue), so entries for different cities on the same queue
+  cause a single upstream request.
+  """
 
   def __init__(self, session: ClientSession) -> None:
     """Initialize the client with an aiohttp session."""
     self._session = session
+    self._queues_cache: dict[str, tuple[float, list[str]]] = {}
+    self._schedule_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+    self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
 
   async def async_get_cities(self) -> list[str]:
     """Return currently selectable cities (Ivano-Frankivsk oblast only)."""
@@ -178,22 +193,70 @@ class PowerRouletteApiClient:
       return LvivProvider(self._session)
     raise ValueError(f"City not supported: {city}")
 
+  def provider_key(self, city: str) -> str:
+    """Return an identifier of the upstream host serving ``city``."""
+    if city in IF_CITIES:
+      return IF_BASE_URL
+    if city in LVIV_CITIES:
+      return LVIV_BASE_URL
+    raise ValueError(f"City not supported: {city}")
+
+  def source_key(self, city: str, queue: str | int) -> str:
+    """Return the data source shared by every city served by the same provider queue."""
+    return f"{self.provider_key(city)}#{queue}"
+
   async def async_get_queues(self, city: str | None = None) -> list[str]:
     """Fetch available queues for a city."""
     if not city:
       return []
+    key = self.provider_key(city)
+    cached = self._queues_cache.get(key)
+    if cached and time.monotonic() - cached[0] < QUEUES_CACHE_TTL_SECONDS:
+      return list(cached[1])
     provider = self._provider_for_city(city)
-    return await provider.async_get_queues()
+    queues = await provider.async_get_queues()
+    self._queues_cache[key] = (time.monotonic(), queues)
+    return list(queues)
 
   async def async_get_schedule(self, city: str, queue: str | int) -> dict[str, Any]:
     """Fetch blackout schedule for the given queue and normalize."""
-    provider = self._provider_for_city(city)
-    payload = await provider.async_get_schedule(queue)
+    payload = await self._async_get_source_payload(city, queue)
     schedule = payload.get("schedule", [])
 
     return {
         "city": city,
         "queue": str(queue),
-        "schedule": schedule,
-        "retrieved_at": datetime.utcnow().isoformat(),
+        # Callers annotate the schedule in place; give each its own copy.
+        "schedule": copy.deepcopy(schedule),
+        "retrieved_at": payload["retrieved_at"],
     }
+
+  async def _async_get_source_payload(self, city: str, queue: str | int) -> dict[str, Any]:
+    """Return the provider payload for a source, sharing recent and in-flight fetches."""
+    key = self.source_key(city, queue)
+    cached = self._schedule_cache.get(key)
+    if cached and time.monotonic() - cached[0] < SCHEDULE_CACHE_TTL_SECONDS:
+      return cached[1]
+    if key in self._inflight:
+      return await asyncio.shield(self._inflight[key])
+
+    future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+    self._inflight[key] = future
+    try:
+      provider = self._provider_for_city(city)
+      payload = await provider.async_get_schedule(queue)
+      payload["retrieved_at"] = datetime.utcnow().isoformat()
+      self._schedule_cache[key] = (time.monotonic(), payload)
+      future.set_result(payload)
+      return payload
+    except Exception as err:
+      future.set_exception(err)
+      # Mark retrieved so a failure with no other waiters is not logged as unhandled.
+      future.exception()
+      raise
+    finally:
+      del self._inflight[key]
+      if not future.done():
+        # The owning task was cancelled; fail the waiters instead of leaving them hanging.
+        future.set_exception(RuntimeError(f"Shared schedule fetch for {key} was cancelled"))
+        future.exception()
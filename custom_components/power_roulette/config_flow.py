@@ -6,17 +6,18 @@ from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 
+from . import async_get_client
 from .api import PowerRouletteApiClient
-from .const import DOMAIN
+from .const import DOMAIN, KIND_AGGREGATE, KIND_SITE
 
 
 class PowerRouletteConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
   """Handle a config flow for Power Roulette."""
 
-  VERSION = 1
+  VERSION = 2
 
   def __init__(self) -> None:
     """Init flow state."""
@@ -24,10 +25,16 @@ class PowerRouletteConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     self._client: PowerRouletteApiClient | None = None
 
   async def async_step_user(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
-    """Handle the initial step."""
+    """Handle the initial step: one site, many queues at once, or an aggregate."""
+    menu_options = ["city", "bulk"]
+    if len(_site_entries(self.hass)) >= 2:
+      menu_options.append("aggregate")
+    return self.async_show_menu(step_id="user", menu_options=menu_options)
+
+  async def async_step_city(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
+    """Select a city."""
     if self._client is None:
-      session = async_get_clientsession(self.hass)
-      self._client = PowerRouletteApiClient(session)
+      self._client = async_get_client(self.hass)
 
     errors: dict[str, str] = {}
     if user_input is not None:
@@ -44,7 +51,7 @@ class PowerRouletteConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
       data_schema = vol.Schema({vol.Required("city"): vol.In(cities)})
     else:
       data_schema = vol.Schema({vol.Required("city"): str})
-    return self.async_show_form(step_id="user", data_schema=data_schema, errors=errors)
+    return self.async_show_form(step_id="city", data_schema=data_schema, errors=errors)
 
   async def async_step_queue(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
     """Select queue for the chosen city."""
@@ -56,7 +63,7 @@ class PowerRouletteConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
       unique_id = f"{self._city.lower()}-{queue}"
       await self.async_set_unique_id(unique_id)
       self._abort_if_unique_id_configured()
-      return self.async_create_entry(title=f"{self._city} ({queue})", data={"city": self._city, "queue": queue})
+      return self.async_create_entry(title=f"{self._city} ({queue})", data=_site_data(self._city, queue))
 
     try:
       queues = await self._client.async_get_queues(self._city)
@@ -75,13 +82,113 @@ class PowerRouletteConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         description_placeholders={"city": self._city},
     )
 
+  async def async_step_bulk(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
+    """Select a city for adding several queues at once."""
+    if self._client is None:
+      self._client = async_get_client(self.hass)
+
+    if user_input is not None:
+      self._city = user_input["city"]
+      return await self.async_step_bulk_queues()
+
+    cities = await self._client.async_get_cities()
+    data_schema = vol.Schema({vol.Required("city"): vol.In(cities)})
+    return self.async_show_form(step_id="bulk", data_schema=data_schema)
+
+  async def async_step_bulk_queues(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
+    """Create one entry per selected queue from a single queue list fetch."""
+    assert self._city  # guarded in previous step
+    errors: dict[str, str] = {}
+    configured = {entry.unique_id for entry in self._async_current_entries()}
+
+    if user_input is not None:
+      selected = [queue for queue in user_input["queues"] if f"{self._city.lower()}-{queue}" not in configured]
+      if not selected:
+        errors["queues"] = "no_queues_selected"
+      else:
+        # A flow creates a single entry; the rest go through import flows, which do not touch the network.
+        for queue in selected[1:]:
+          self.hass.async_create_task(
+              self.hass.config_entries.flow.async_init(
+                  DOMAIN,
+                  context={"source": config_entries.SOURCE_IMPORT},
+                  data=_site_data(self._city, queue),
+              )
+          )
+        return await self.async_step_import(_site_data(self._city, selected[0]))
+
+    try:
+      queues = await self._client.async_get_queues(self._city)
+    except Exception:  # noqa: BLE001
+      return self.async_abort(reason="cannot_connect")
+
+    available = [queue for queue in queues if f"{self._city.lower()}-{queue}" not in configured]
+    if not available:
+      return self.async_abort(reason="already_configured")
+    data_schema = vol.Schema({vol.Required("queues"): cv.multi_select({queue: queue for queue in available})})
+    return self.async_show_form(
+        step_id="bulk_queues",
+        data_schema=data_schema,
+        errors=errors,
+        description_placeholders={"city": self._city},
+    )
+
+  async def async_step_import(self, import_data: dict[str, Any]) -> config_entries.ConfigFlowResult:
+    """Create a site entry from already validated data (used by bulk setup)."""
+    city = import_data["city"]
+    queue = import_data["queue"]
+    await self.async_set_unique_id(f"{city.lower()}-{queue}")
+    self._abort_if_unique_id_configured()
+    return self.async_create_entry(title=f"{city} ({queue})", data=_site_data(city, queue))
+
+  async def async_step_aggregate(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
+    """Combine several configured sites into one availability view."""
+    errors: dict[str, str] = {}
+    sites = {entry.entry_id: entry.title for entry in _site_entries(self.hass)}
+
+    if user_input is not None:
+      selected = sorted(user_input["entries"])
+      if len(selected) < 2:
+        errors["entries"] = "too_few_sites"
+      else:
+        await self.async_set_unique_id(f"{KIND_AGGREGATE}-{'-'.join(selected)}")
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=user_input["name"],
+            data={"kind": KIND_AGGREGATE, "entries": selected},
+        )
+
+    data_schema = vol.Schema(
+        {
+            vol.Required("name", default="All sites"): str,
+            vol.Required("entries", default=list(sites)): cv.multi_select(sites),
+        }
+    )
+    return self.async_show_form(step_id="aggregate", data_schema=data_schema, errors=errors)
+
   @staticmethod
   @callback
   def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
     """Return the options flow handler."""
+    if config_entry.data.get("kind") == KIND_AGGREGATE:
+      return PowerRouletteAggregateOptionsFlow(config_entry)
     return PowerRouletteOptionsFlow(config_entry)
 
 
+def _site_data(city: str, queue: str) -> dict[str, Any]:
+  """Return config entry data for a single city/queue site."""
+  return {"kind": KIND_SITE, "city": city, "queue": queue}
+
+
+def _site_entries(hass: HomeAssistant) -> list[config_entries.ConfigEntry]:
+  """Return configured single-site entries (excluding aggregates)."""
+  return [
+      entry
+      for entry in hass.config_entries.async_entries(DOMAIN)
+      if entry.data.get("kind") != KIND_AGGREGATE
+  ]
+
+
 class PowerRouletteOptionsFlow(config_entries.OptionsFlow):
   """Handle options for Power Roulette."""
 
@@ -94,8 +201,7 @@ class PowerRouletteOptionsFlow(config_entries.OptionsFlow):
   async def async_step_init(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
     """First step of the options flow: pick a city."""
     if self._client is None:
-      session = async_get_clientsession(self.hass)
-      self._client = PowerRouletteApiClient(session)
+      self._client = async_get_client(self.hass)
 
     errors: dict[str, str] = {}
     if user_input is not None:
@@ -143,3 +249,34 @@ class PowerRouletteOptionsFlow(config_entries.OptionsFlow):
         errors=errors,
         description_placeholders={"city": self._city},
     )
+
+
+class PowerRouletteAggregateOptionsFlow(config_entries.OptionsFlow):
+  """Change which sites an aggregate entry combines."""
+
+  def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+    """Initialize options flow."""
+    self.config_entry = config_entry
+
+  async def async_step_init(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
+    """Entry point of the options flow."""
+    return await self.async_step_aggregate(user_input)
+
+  async def async_step_aggregate(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
+    """Pick the sites to aggregate."""
+    errors: dict[str, str] = {}
+    sites = {entry.entry_id: entry.title for entry in _site_entries(self.hass)}
+
+    if user_input is not None:
+      selected = sorted(user_input["entries"])
+      if len(selected) >= 2:
+        return self.async_create_entry(title="", data={"entries": selected})
+      errors["entries"] = "too_few_sites"
+
+    current = self.config_entry.options.get("entries", self.config_entry.data.get("entries", []))
+    data_schema = vol.Schema(
+        {
+            vol.Required("entries", default=[entry_id for entry_id in current if entry_id in sites]): cv.multi_select(sites),
+        }
+    )
+    return self.async_show_form(step_id="aggregate", data_schema=data_schema, errors=errors)
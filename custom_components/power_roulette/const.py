@@ -6,6 +6,22 @@ DOMAIN = "power_roulette"
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 DEFAULT_UPDATE_INTERVAL_MINUTES = 5
 
+# Domain-wide refresh scheduling (see scheduler.py).
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+DATA_CLIENT = f"{DOMAIN}_client"
+DATA_STABILITY = f"{DOMAIN}_stability"
+REFRESH_MAX_CONCURRENCY_PER_PROVIDER = 2
+REFRESH_JITTER_SECONDS = 15
+REFRESH_STARTUP_SPREAD_SECONDS = 60
+
+# Bounds for per-day schedule revision tracking.
+SCHEDULE_REVISION_CACHE_SIZE = 14
+SCHEDULE_REVISION_HISTORY_SIZE = 20
+
+# Config entry kinds: a single city/queue site, or an aggregate over several sites.
+KIND_SITE = "site"
+KIND_AGGREGATE = "aggregate"
+
 # Only Ivano-Frankivsk oblast cities (queues are shared).
 IF_CITIES: tuple[str, ...] = (
     "Івано-Франківськ",
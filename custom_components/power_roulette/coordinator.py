@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from typing import Any
@@ -11,31 +15,101 @@ from homeassistant.util import dt as dt_util
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import PowerRouletteApiClient
-from .const import DEFAULT_UPDATE_INTERVAL_MINUTES, DOMAIN
+from .const import (
+    DOMAIN,
+    SCHEDULE_REVISION_CACHE_SIZE,
+    SCHEDULE_REVISION_HISTORY_SIZE,
+)
+from .stability import ScheduleStability, StabilityStore
 
 LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class _DayRevision:
+  """Normalized schedule of one day, keyed by the provider's revision fields."""
+
+  key: tuple[Any, ...]
+  revision: int
+  changed_at: datetime
+  intervals: list[dict[str, Any]]
+  spans: list[tuple[datetime, datetime]]
+
+
+def _revision_key(day: dict[str, Any]) -> tuple[Any, ...]:
+  """Identify a day's schedule version.
+
+  Uses createdAt/scheduleApprovedSince when the provider sends them, otherwise the
+  raw intervals themselves.
+  """
+  if day.get("created_at") or day.get("approved_at"):
+    return (day.get("created_at"), day.get("approved_at"))
+  return tuple((interval.get("from"), interval.get("to")) for interval in day.get("intervals", []))
+
+
+def _revision_time(day: dict[str, Any], tz: Any) -> datetime | None:
+  """Return when the provider published a day's revision (approved, else created), in UTC."""
+  for raw in (day.get("approved_at"), day.get("created_at")):
+    if not raw:
+      continue
+    parsed = dt_util.parse_datetime(str(raw))
+    if parsed is None:
+      try:
+        parsed = datetime.strptime(str(raw), "%d.%m.%Y %H:%M")
+      except ValueError:
+        continue
+    if parsed.tzinfo is None:
+      parsed = parsed.replace(tzinfo=tz)
+    return dt_util.as_utc(parsed)
+  return None
+
+
 class PowerRouletteCoordinator(DataUpdateCoordinator[dict[str, Any]]):
   """Coordinator to poll the Power Roulette API."""
 
-  def __init__(self, hass: HomeAssistant, client: PowerRouletteApiClient, city: str, queue: str | int) -> None:
-    """Initialize the coordinator."""
+  def __init__(
+      self,
+      hass: HomeAssistant,
+      client: PowerRouletteApiClient,
+      city: str,
+      queue: str | int,
+      semaphore: asyncio.Semaphore | None = None,
+      stability_store: StabilityStore | None = None,
+  ) -> None:
+    """Initialize the coordinator.
+
+    Refresh timing is owned by the domain scheduler, so no ``update_interval`` is set;
+    ``semaphore`` bounds concurrent requests to the same provider and
+    ``stability_store`` keeps revision statistics per data source across restarts.
+    """
     self.client = client
     self.city = city
     self.queue = queue
+    self._semaphore = semaphore
+    # Sorted (start, end) UTC outage intervals from the last successful refresh.
+    self.intervals: list[tuple[datetime, datetime]] = []
+    # Recently seen day revisions (LRU by event date) and an audit trail of changes.
+    self._revisions: OrderedDict[str, _DayRevision] = OrderedDict()
+    self.revision_history: deque[dict[str, Any]] = deque(maxlen=SCHEDULE_REVISION_HISTORY_SIZE)
+    self._stability_store = stability_store
+    self._stability_key = client.source_key(city, queue)
+    self.stability = stability_store.get(self._stability_key) if stability_store else ScheduleStability()
 
     super().__init__(
         hass,
         LOGGER,
         name=f"{DOMAIN}_coordinator",
-        update_interval=timedelta(minutes=DEFAULT_UPDATE_INTERVAL_MINUTES),
+        update_interval=None,
     )
 
   async def _async_update_data(self) -> dict[str, Any]:
     """Fetch data from the API."""
     try:
-      data = await self.client.async_get_schedule(self.city, self.queue)
+      if self._semaphore:
+        async with self._semaphore:
+          data = await self.client.async_get_schedule(self.city, self.queue)
+      else:
+        data = await self.client.async_get_schedule(self.city, self.queue)
       now = dt_util.utcnow()
       tz = (
           dt_util.get_time_zone(self.hass.config.time_zone)
@@ -53,31 +127,58 @@ class PowerRouletteCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return dt_util.as_utc(local_dt)
 
       intervals_all: list[tuple[datetime, datetime]] = []
+      last_changed: datetime | None = None
 
       for day in data.get("schedule", []):
         date_str = day.get("event_date")
         if not date_str:
           continue
 
-        for interval in day.get("intervals", []):
-          start_raw = interval.get("from")
-          end_raw = interval.get("to")
-          if not start_raw or not end_raw:
-            continue
-          start_dt = _combine(date_str, start_raw)
-          end_dt = _combine(date_str, end_raw)
-          if not start_dt or not end_dt:
-            continue
-          # If the interval crosses midnight, push the end to the next day.
-          if end_dt <= start_dt:
-            end_dt = end_dt + timedelta(days=1)
-
-          # Persist normalized datetimes for UI cards
-          interval["start_iso"] = start_dt.isoformat()
-          interval["end_iso"] = end_dt.isoformat()
-          intervals_all.append((start_dt, end_dt))
+        key = _revision_key(day)
+        cached = self._revisions.get(date_str)
+        if cached and cached.key == key:
+          # Same revision as last time: reuse the normalized intervals.
+          self._revisions.move_to_end(date_str)
+        else:
+          spans = self._normalize_day(day, _combine)
+          if not self.stability.is_counted(date_str, key):
+            if cached:
+              self.stability.record_revision(cached.spans, spans)
+            else:
+              self.stability.record_publication(spans)
+            self.stability.remember(date_str, key)
+            if self._stability_store:
+              self._stability_store.async_update(self._stability_key, self.stability)
+          cached = _DayRevision(
+              key=key,
+              revision=cached.revision + 1 if cached else 1,
+              changed_at=_revision_time(day, tz) or now,
+              intervals=day.get("intervals", []),
+              spans=spans,
+          )
+          self._revisions[date_str] = cached
+          self._revisions.move_to_end(date_str)
+          while len(self._revisions) > SCHEDULE_REVISION_CACHE_SIZE:
+            self._revisions.popitem(last=False)
+          self.revision_history.append(
+              {
+                  "event_date": date_str,
+                  "revision": cached.revision,
+                  "created_at": day.get("created_at"),
+                  "approved_at": day.get("approved_at"),
+                  "changed_at": cached.changed_at.isoformat(),
+              }
+          )
+
+        day["intervals"] = cached.intervals
+        day["revision"] = cached.revision
+        day["revision_changed_at"] = cached.changed_at.isoformat()
+        intervals_all.extend(cached.spans)
+        if last_changed is None or cached.changed_at > last_changed:
+          last_changed = cached.changed_at
 
       intervals_all.sort(key=lambda pair: pair[0])
+      self.intervals = intervals_all
 
       current_interval: tuple[datetime, datetime] | None = None
       next_interval: tuple[datetime, datetime] | None = None
@@ -104,6 +205,39 @@ class PowerRouletteCoordinator(DataUpdateCoordinator[dict[str, Any]]):
       data["next_outage"] = next_outage_iso
       data["next_restore"] = next_restore_iso
       data["current_status"] = current_status
+      data["schedule_changed_at"] = last_changed.isoformat() if last_changed else None
+      data["revision_history"] = list(self.revision_history)
+      confidence = self.stability.confidence
+      expected_drift = self.stability.expected_drift_minutes
+      data["confidence"] = round(confidence, 3) if confidence is not None else None
+      data["expected_drift_minutes"] = round(expected_drift, 1) if expected_drift is not None else None
+      data["stability"] = self.stability.as_dict()
       return data
     except Exception as err:  # noqa: BLE001 - broad to surface unexpected API issues
       raise UpdateFailed(f"Error communicating with Power Roulette API: {err}") from err
+
+  @staticmethod
+  def _normalize_day(
+      day: dict[str, Any], combine: Callable[[str, str], datetime | None]
+  ) -> list[tuple[datetime, datetime]]:
+    """Attach UTC ISO bounds to a day's intervals and return them as datetimes."""
+    date_str = day["event_date"]
+    spans: list[tuple[datetime, datetime]] = []
+    for interval in day.get("intervals", []):
+      start_raw = interval.get("from")
+      end_raw = interval.get("to")
+      if not start_raw or not end_raw:
+        continue
+      start_dt = combine(date_str, start_raw)
+      end_dt = combine(date_str, end_raw)
+      if not start_dt or not end_dt:
+        continue
+      # If the interval crosses midnight, push the end to the next day.
+      if end_dt <= start_dt:
+        end_dt = end_dt + timedelta(days=1)
+
+      # Persist normalized datetimes for UI cards
+      interval["start_iso"] = start_dt.isoformat()
+      interval["end_iso"] = end_dt.isoformat()
+      spans.append((start_dt, end_dt))
+    return spans
@@ -0,0 +1,133 @@
+"""Domain-wide refresh scheduling for Power Roulette coordinators."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import random
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEFAULT_UPDATE_INTERVAL_MINUTES,
+    REFRESH_JITTER_SECONDS,
+    REFRESH_MAX_CONCURRENCY_PER_PROVIDER,
+    REFRESH_STARTUP_SPREAD_SECONDS,
+)
+from .coordinator import PowerRouletteCoordinator
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _seconds_to_boundary(coordinator: PowerRouletteCoordinator, now: datetime) -> float:
+  """Return seconds until the coordinator's nearest known outage/restore boundary."""
+  data = coordinator.data or {}
+  nearest = float("inf")
+  for key in ("next_outage", "next_restore"):
+    boundary = dt_util.parse_datetime(data[key]) if data.get(key) else None
+    if boundary and boundary > now:
+      nearest = min(nearest, (boundary - now).total_seconds())
+  return nearest
+
+
+class PowerRouletteRefreshScheduler:
+  """Drive refreshes of all site coordinators from one timer.
+
+  A newly registered data source is first fetched at a random point within a short
+  startup window, then gets a random phase within the update interval, so entries set
+  up together (e.g. after a restart) do not poll together. Requests to the same
+  provider share a semaphore, and when several entries are due at once those without
+  data go first, then the one closest to an outage/restore.
+  Entries reading the same source share its phase, so their refreshes coincide and are
+  served by the client's single shared fetch.
+  """
+
+  def __init__(self, hass: HomeAssistant) -> None:
+    """Initialize the scheduler."""
+    self._hass = hass
+    self._interval = timedelta(minutes=DEFAULT_UPDATE_INTERVAL_MINUTES)
+    self._coordinators: dict[str, PowerRouletteCoordinator] = {}
+    self._sources: dict[str, str] = {}
+    self._due: dict[str, datetime] = {}
+    # Entries whose first (startup) refresh has been started.
+    self._started: set[str] = set()
+    self._semaphores: dict[str, asyncio.Semaphore] = {}
+    self._unsub_timer: CALLBACK_TYPE | None = None
+
+  def semaphore(self, provider: str) -> asyncio.Semaphore:
+    """Return the semaphore bounding in-flight requests to ``provider``."""
+    if provider not in self._semaphores:
+      self._semaphores[provider] = asyncio.Semaphore(REFRESH_MAX_CONCURRENCY_PER_PROVIDER)
+    return self._semaphores[provider]
+
+  @callback
+  def async_register(self, entry_id: str, coordinator: PowerRouletteCoordinator, source: str) -> CALLBACK_TYPE:
+    """Schedule periodic refreshes for a coordinator; return a callback that stops them."""
+    self._coordinators[entry_id] = coordinator
+    self._sources[entry_id] = source
+    peers = [other for other, other_source in self._sources.items() if other_source == source and other in self._due]
+    if peers:
+      self._due[entry_id] = self._due[peers[0]]
+    else:
+      delay = random.uniform(0, REFRESH_STARTUP_SPREAD_SECONDS)
+      self._due[entry_id] = dt_util.utcnow() + timedelta(seconds=delay)
+    self._async_arm()
+
+    @callback
+    def _unregister() -> None:
+      self._coordinators.pop(entry_id, None)
+      self._sources.pop(entry_id, None)
+      self._due.pop(entry_id, None)
+      self._started.discard(entry_id)
+      self._async_arm()
+
+    return _unregister
+
+  @callback
+  def _async_arm(self) -> None:
+    """Point the timer at the earliest due entry."""
+    if self._unsub_timer:
+      self._unsub_timer()
+      self._unsub_timer = None
+    if self._due:
+      self._unsub_timer = async_track_point_in_utc_time(self._hass, self._async_fire, min(self._due.values()))
+
+  @callback
+  def _async_fire(self, _now: datetime) -> None:
+    """Start refreshes for every due entry: missing data first, then nearest boundary."""
+    self._unsub_timer = None
+    now = dt_util.utcnow()
+    due_ids = [entry_id for entry_id, due in self._due.items() if due <= now]
+    # Entries without data (startup, late peers, failed fetches) first, then nearest boundary.
+    due_ids.sort(
+        key=lambda entry_id: (
+            self._coordinators[entry_id].data is not None,
+            _seconds_to_boundary(self._coordinators[entry_id], now),
+        )
+    )
+
+    # Entries on the same source are due together; keep them together.
+    next_due_by_source: dict[str, datetime] = {}
+    for entry_id in due_ids:
+      source = self._sources[entry_id]
+      if source not in next_due_by_source:
+        if entry_id in self._started:
+          jitter = random.uniform(-REFRESH_JITTER_SECONDS, REFRESH_JITTER_SECONDS)
+          next_due = self._due[entry_id] + self._interval + timedelta(seconds=jitter)
+        else:
+          # After the startup fetch, pick the source's phase: any offset within one
+          # interval, centred on a full interval so the next fetch is not immediate.
+          next_due = now + self._interval * random.uniform(0.5, 1.5)
+        next_due_by_source[source] = next_due if next_due > now else now + self._interval
+      self._due[entry_id] = next_due_by_source[source]
+      self._started.add(entry_id)
+      # Tasks queue on the provider semaphore in creation order, so sorting above sets priority.
+      self._hass.async_create_background_task(
+          self._coordinators[entry_id].async_refresh(),
+          name=f"power_roulette refresh {entry_id}",
+      )
+
+    self._async_arm()
@@ -2,24 +2,42 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import MATCH_ALL
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_utc_time_change
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .aggregate import PowerRouletteAggregateCoordinator
+from .const import DOMAIN, KIND_AGGREGATE
 from .coordinator import PowerRouletteCoordinator
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
   """Set up sensors from a config entry."""
+  if entry.data.get("kind") == KIND_AGGREGATE:
+    aggregate: PowerRouletteAggregateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    async_add_entities(
+        [
+            AggregateStatusSensor(aggregate, entry, "any"),
+            AggregateStatusSensor(aggregate, entry, "all"),
+            AggregateNextTransitionSensor(aggregate, entry),
+        ]
+    )
+    return
+
   coordinator: PowerRouletteCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+  ticker = CountdownTicker(hass)
+  entry.async_on_unload(ticker.async_stop)
+  hass.data[DOMAIN][entry.entry_id]["ticker"] = ticker
   async_add_entities(
       [
           NextOutageSensor(coordinator, entry),
@@ -31,7 +49,80 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
   )
 
 
-class NextOutageSensor(CoordinatorEntity[PowerRouletteCoordinator], SensorEntity):
+class CountdownTicker:
+  """Per-entry minute tick shared by all of the entry's sensors.
+
+  One timer re-renders every registered sensor in a single pass; each sensor only
+  writes its state when the rendered value actually changed.
+  """
+
+  def __init__(self, hass: HomeAssistant) -> None:
+    """Initialize the ticker."""
+    self._hass = hass
+    self._entities: list[_ChangeOnlySensorMixin] = []
+    self._unsub_timer: CALLBACK_TYPE | None = None
+
+  @callback
+  def async_register(self, entity: _ChangeOnlySensorMixin) -> Callable[[], None]:
+    """Add an entity to the tick and start the timer on first use."""
+    self._entities.append(entity)
+    if self._unsub_timer is None:
+      self._unsub_timer = async_track_utc_time_change(self._hass, self._tick, second=0)
+
+    @callback
+    def _unregister() -> None:
+      if entity in self._entities:
+        self._entities.remove(entity)
+      if not self._entities:
+        self.async_stop()
+
+    return _unregister
+
+  @callback
+  def async_stop(self) -> None:
+    """Cancel the timer."""
+    if self._unsub_timer:
+      self._unsub_timer()
+      self._unsub_timer = None
+
+  @callback
+  def _tick(self, _now: datetime) -> None:
+    for entity in self._entities:
+      entity.async_write_if_changed()
+
+
+class _ChangeOnlySensorMixin:
+  """Skip state writes whose rendered value and attributes did not change."""
+
+  _last_rendered: tuple[Any, ...] | None = None
+
+  def _render(self) -> tuple[Any, ...]:
+    return (self.available, self.native_value, self.extra_state_attributes)
+
+  @callback
+  def async_write_if_changed(self) -> None:
+    """Write state only if it differs from the last written state."""
+    if self.hass is None:
+      return
+    rendered = self._render()
+    if rendered == self._last_rendered:
+      return
+    self._last_rendered = rendered
+    self.async_write_ha_state()
+
+  @callback
+  def _handle_coordinator_update(self) -> None:
+    self.async_write_if_changed()
+
+  async def async_added_to_hass(self) -> None:
+    """Join the entry's shared tick."""
+    await super().async_added_to_hass()
+    ticker: CountdownTicker | None = self.hass.data[DOMAIN][self._entry.entry_id].get("ticker")
+    if ticker:
+      self.async_on_remove(ticker.async_register(self))
+
+
+class NextOutageSensor(_ChangeOnlySensorMixin, CoordinatorEntity[PowerRouletteCoordinator], SensorEntity):
   """Sensor showing the next planned outage."""
 
   _attr_has_entity_name = True
@@ -69,15 +160,20 @@ class NextOutageSensor(CoordinatorEntity[PowerRouletteCoordinator], SensorEntity
         "city": data.get("city"),
         "queue": data.get("queue"),
         "retrieved_at": data.get("retrieved_at"),
+        "schedule_changed_at": data.get("schedule_changed_at"),
+        "confidence": data.get("confidence"),
+        "expected_drift_minutes": data.get("expected_drift_minutes"),
     }
 
 
-class NextOutageTextSensor(CoordinatorEntity[PowerRouletteCoordinator], SensorEntity):
+class NextOutageTextSensor(_ChangeOnlySensorMixin, CoordinatorEntity[PowerRouletteCoordinator], SensorEntity):
   """Formatted next outage time with relative countdown and local time."""
 
   _attr_has_entity_name = True
   _attr_name = "Next outage (detailed)"
   _attr_icon = "mdi:clock-alert-outline"
+  # Attributes duplicate the timestamp sensors; keep them out of the recorder.
+  _unrecorded_attributes = frozenset({MATCH_ALL})
 
   def __init__(self, coordinator: PowerRouletteCoordinator, entry: ConfigEntry) -> None:
     """Initialize the sensor."""
@@ -148,7 +244,7 @@ def _next_restore_datetime(data: dict[str, Any]) -> datetime | None:
   return next_future_end
 
 
-class NextRestoreSensor(CoordinatorEntity[PowerRouletteCoordinator], SensorEntity):
+class NextRestoreSensor(_ChangeOnlySensorMixin, CoordinatorEntity[PowerRouletteCoordinator], SensorEntity):
   """Sensor showing when power is expected to return."""
 
   _attr_has_entity_name = True
@@ -184,15 +280,19 @@ class NextRestoreSensor(CoordinatorEntity[PowerRouletteCoordinator], SensorEntit
         "queue": data.get("queue"),
         "retrieved_at": data.get("retrieved_at"),
         "current_status": data.get("current_status"),
+        "confidence": data.get("confidence"),
+        "expected_drift_minutes": data.get("expected_drift_minutes"),
     }
 
 
-class NextRestoreTextSensor(CoordinatorEntity[PowerRouletteCoordinator], SensorEntity):
+class NextRestoreTextSensor(_ChangeOnlySensorMixin, CoordinatorEntity[PowerRouletteCoordinator], SensorEntity):
   """Formatted next restore time with relative countdown."""
 
   _attr_has_entity_name = True
   _attr_name = "Next power restore (detailed)"
   _attr_icon = "mdi:clock-check-outline"
+  # Attributes duplicate the timestamp sensors; keep them out of the recorder.
+  _unrecorded_attributes = frozenset({MATCH_ALL})
 
   def __init__(self, coordinator: PowerRouletteCoordinator, entry: ConfigEntry) -> None:
     """Initialize the sensor."""
@@ -234,7 +334,7 @@ class NextRestoreTextSensor(CoordinatorEntity[PowerRouletteCoordinator], SensorE
     }
 
 
-class ScheduleSensor(CoordinatorEntity[PowerRouletteCoordinator], SensorEntity):
+class ScheduleSensor(_ChangeOnlySensorMixin, CoordinatorEntity[PowerRouletteCoordinator], SensorEntity):
   """Sensor exposing current power status plus full outage schedule for charts."""
 
   _attr_has_entity_name = True
@@ -270,4 +370,90 @@ class ScheduleSensor(CoordinatorEntity[PowerRouletteCoordinator], SensorEntity):
         "schedule": schedule,
         "next_outage": data.get("next_outage"),
         "next_restore": data.get("next_restore"),
+        "schedule_changed_at": data.get("schedule_changed_at"),
+        "revision_history": data.get("revision_history"),
+        "stability": data.get("stability"),
+    }
+
+
+class AggregateStatusSensor(_ChangeOnlySensorMixin, CoordinatorEntity[PowerRouletteAggregateCoordinator], SensorEntity):
+  """Whether any (or all) of the aggregated sites currently have power."""
+
+  _attr_has_entity_name = True
+
+  def __init__(self, coordinator: PowerRouletteAggregateCoordinator, entry: ConfigEntry, mode: str) -> None:
+    """Initialize the sensor; ``mode`` is ``any`` or ``all``."""
+    super().__init__(coordinator)
+    self._entry = entry
+    self._mode = mode
+    self._attr_name = "Any site powered" if mode == "any" else "All sites powered"
+    self._attr_icon = "mdi:transmission-tower" if mode == "any" else "mdi:home-lightning-bolt"
+    self._attr_unique_id = f"{entry.entry_id}_{mode}_powered"
+    self._attr_device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Power Roulette",
+        manufacturer="Power Roulette",
+        entry_type=None,
+    )
+
+  @property
+  def native_value(self) -> str | None:
+    """Return ``on`` when the condition holds, ``off`` otherwise."""
+    data = self.coordinator.data or {}
+    powered = data.get(f"{self._mode}_powered")
+    if powered is None:
+      return None
+    return "on" if powered else "off"
+
+  @property
+  def extra_state_attributes(self) -> dict[str, Any]:
+    """Return additional attributes."""
+    data = self.coordinator.data or {}
+    return {
+        "next_change": data.get(f"next_{self._mode}_change"),
+        "sites_total": data.get("sites_total"),
+        "sites_without_power": data.get("sites_without_power"),
+        "sites_unknown": data.get("sites_unknown"),
+        "sites": data.get("sites"),
+    }
+
+
+class AggregateNextTransitionSensor(_ChangeOnlySensorMixin, CoordinatorEntity[PowerRouletteAggregateCoordinator], SensorEntity):
+  """Next instant at which the number of sites without power changes."""
+
+  _attr_has_entity_name = True
+  _attr_name = "Next transition"
+  _attr_icon = "mdi:timeline-clock-outline"
+  _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+  def __init__(self, coordinator: PowerRouletteAggregateCoordinator, entry: ConfigEntry) -> None:
+    """Initialize the sensor."""
+    super().__init__(coordinator)
+    self._entry = entry
+    self._attr_unique_id = f"{entry.entry_id}_next_transition"
+    self._attr_device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Power Roulette",
+        manufacturer="Power Roulette",
+        entry_type=None,
+    )
+
+  @property
+  def native_value(self) -> Any:
+    """Return the next transition time."""
+    data = self.coordinator.data or {}
+    transition_raw = data.get("next_transition")
+    if transition_raw:
+      return dt_util.parse_datetime(transition_raw)
+    return None
+
+  @property
+  def extra_state_attributes(self) -> dict[str, Any]:
+    """Return additional attributes."""
+    data = self.coordinator.data or {}
+    return {
+        "next_any_change": data.get("next_any_change"),
+        "next_all_change": data.get("next_all_change"),
+        "sites_without_power": data.get("sites_without_power"),
+        "sites_unknown": data.get("sites_unknown"),
     }
@@ -0,0 +1,175 @@
+"""Running statistics of how much published schedules move before they happen."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+import json
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+# Revised intervals are paired with the closest new interval within this window;
+# anything further apart counts as dropped rather than shifted.
+MATCH_WINDOW = timedelta(hours=3)
+# Weight of the latest observation in the running mean shift.
+SHIFT_EWMA_ALPHA = 0.2
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.stability"
+# Counters change at most a few times a day; batch writes.
+STORAGE_SAVE_DELAY_SECONDS = 60
+# Days whose last revision key is remembered, so a restart does not re-count them.
+SEEN_DAYS = 14
+_COUNTER_FIELDS = ("published", "shifted", "dropped", "revisions", "mean_shift_minutes", "max_shift_minutes")
+
+
+class ScheduleStability:
+  """Incremental per-queue revision statistics (constant memory).
+
+  Every interval seen on first publication of a day counts as published; every later
+  revision of that day compares old and new intervals and counts each old one as
+  unchanged, shifted (by how many minutes) or dropped.
+  """
+
+  def __init__(self) -> None:
+    """Initialize empty statistics."""
+    self.published = 0
+    self.shifted = 0
+    self.dropped = 0
+    self.revisions = 0
+    self.mean_shift_minutes = 0.0
+    self.max_shift_minutes = 0.0
+    # event date -> encoded revision key of the last version counted
+    self.seen: OrderedDict[str, str] = OrderedDict()
+
+  def is_counted(self, event_date: str, key: tuple[Any, ...]) -> bool:
+    """Return True if this version of the day was already counted (e.g. before a restart)."""
+    return self.seen.get(event_date) == json.dumps(key)
+
+  def remember(self, event_date: str, key: tuple[Any, ...]) -> None:
+    """Mark a version of the day as counted."""
+    self.seen[event_date] = json.dumps(key)
+    self.seen.move_to_end(event_date)
+    while len(self.seen) > SEEN_DAYS:
+      self.seen.popitem(last=False)
+
+  def record_publication(self, spans: Sequence[tuple[datetime, datetime]]) -> None:
+    """Count the intervals of a newly seen day."""
+    self.published += len(spans)
+
+  def record_revision(
+      self,
+      old_spans: Sequence[tuple[datetime, datetime]],
+      new_spans: Sequence[tuple[datetime, datetime]],
+  ) -> None:
+    """Compare a day's previous and revised intervals."""
+    self.revisions += 1
+    unmatched = list(new_spans)
+    for old_start, old_end in old_spans:
+      best: tuple[datetime, datetime] | None = None
+      for candidate in unmatched:
+        gap = abs(candidate[0] - old_start)
+        if gap <= MATCH_WINDOW and (best is None or gap < abs(best[0] - old_start)):
+          best = candidate
+      if best is None:
+        self.dropped += 1
+        continue
+      unmatched.remove(best)
+      shift = max(abs(best[0] - old_start), abs(best[1] - old_end)).total_seconds() / 60
+      if shift:
+        self._record_shift(shift)
+    # Intervals added by the revision are new publications.
+    self.published += len(unmatched)
+
+  def _record_shift(self, minutes: float) -> None:
+    self.shifted += 1
+    if self.shifted == 1:
+      self.mean_shift_minutes = minutes
+    else:
+      self.mean_shift_minutes += SHIFT_EWMA_ALPHA * (minutes - self.mean_shift_minutes)
+    self.max_shift_minutes = max(self.max_shift_minutes, minutes)
+
+  @classmethod
+  def from_storage(cls, stored: dict[str, Any] | None) -> ScheduleStability:
+    """Restore statistics saved by ``to_storage``."""
+    stability = cls()
+    for field in _COUNTER_FIELDS:
+      if stored and field in stored:
+        setattr(stability, field, stored[field])
+    if stored:
+      stability.seen = OrderedDict(stored.get("seen", {}))
+    return stability
+
+  def to_storage(self) -> dict[str, Any]:
+    """Return the raw counters (and counted day versions) for persistence."""
+    stored: dict[str, Any] = {field: getattr(self, field) for field in _COUNTER_FIELDS}
+    stored["seen"] = dict(self.seen)
+    return stored
+
+  @property
+  def change_rate(self) -> float:
+    """Share of published intervals that were later shifted or dropped."""
+    if not self.published:
+      return 0.0
+    return min(1.0, (self.shifted + self.dropped) / self.published)
+
+  @property
+  def confidence(self) -> float | None:
+    """Probability that an upcoming interval stays as published (Laplace-smoothed).
+
+    ``None`` until at least one revision was observed: before that the score would only
+    reflect how many intervals were seen, not how stable they are.
+    """
+    if not self.revisions:
+      return None
+    changed = min(self.published, self.shifted + self.dropped)
+    return (self.published - changed + 1) / (self.published + 2)
+
+  @property
+  def expected_drift_minutes(self) -> float | None:
+    """Expected shift of an upcoming interval, in minutes (``None`` before any revision)."""
+    if not self.revisions:
+      return None
+    if not self.published:
+      return 0.0
+    return min(1.0, self.shifted / self.published) * self.mean_shift_minutes
+
+  def as_dict(self) -> dict[str, Any]:
+    """Return the statistics for state attributes."""
+    return {
+        "published": self.published,
+        "shifted": self.shifted,
+        "dropped": self.dropped,
+        "revisions": self.revisions,
+        "mean_shift_minutes": round(self.mean_shift_minutes, 1),
+        "max_shift_minutes": round(self.max_shift_minutes, 1),
+        "change_rate": round(self.change_rate, 3),
+    }
+
+
+class StabilityStore:
+  """Persist per-source statistics so they survive restarts (one small record each)."""
+
+  def __init__(self, hass: HomeAssistant) -> None:
+    """Initialize the store."""
+    self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    self._data: dict[str, dict[str, Any]] = {}
+
+  async def async_load(self) -> None:
+    """Load saved statistics."""
+    self._data = await self._store.async_load() or {}
+
+  def get(self, source: str) -> ScheduleStability:
+    """Return the statistics saved for ``source`` (empty if none)."""
+    return ScheduleStability.from_storage(self._data.get(source))
+
+  @callback
+  def async_update(self, source: str, stability: ScheduleStability) -> None:
+    """Record new statistics for ``source`` and schedule a save."""
+    self._data[source] = stability.to_storage()
+    self._store.async_delay_save(lambda: self._data, STORAGE_SAVE_DELAY_SECONDS)
@@ -0,0 +1,135 @@
+"""Local HTTP export of normalized schedules."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from hashlib import sha1
+from http import HTTPStatus
+import json
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import PowerRouletteCoordinator
+
+CONTENT_TYPE_JSON = "application/json"
+CONTENT_TYPE_ICAL = "text/calendar"
+
+
+def _schedule_json(coordinator: PowerRouletteCoordinator) -> bytes:
+  """Encode the coordinator's schedule as compact JSON.
+
+  ``retrieved_at`` is left out on purpose so the body, and its ETag, only change
+  when the schedule does.
+  """
+  data = coordinator.data or {}
+  payload = {
+      "city": data.get("city"),
+      "queue": data.get("queue"),
+      "current_status": data.get("current_status"),
+      "next_outage": data.get("next_outage"),
+      "next_restore": data.get("next_restore"),
+      "schedule_changed_at": data.get("schedule_changed_at"),
+      "confidence": data.get("confidence"),
+      "expected_drift_minutes": data.get("expected_drift_minutes"),
+      "intervals": [[start.isoformat(), end.isoformat()] for start, end in coordinator.intervals],
+  }
+  return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _ical_time(value: datetime) -> str:
+  return dt_util.as_utc(value).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _ical_escape(value: str) -> str:
+  """Escape a TEXT property value (RFC 5545 section 3.3.11)."""
+  return (
+      value.replace("\\", "\\\\")
+      .replace(";", "\\;")
+      .replace(",", "\\,")
+      .replace("\r\n", "\\n")
+      .replace("\n", "\\n")
+  )
+
+
+def _schedule_ical(entry_id: str, coordinator: PowerRouletteCoordinator) -> bytes:
+  """Encode the coordinator's outage intervals as an iCalendar feed."""
+  data = coordinator.data or {}
+  stamp = dt_util.parse_datetime(data["schedule_changed_at"]) if data.get("schedule_changed_at") else None
+  dtstamp = _ical_time(stamp or dt_util.utcnow())
+  summary = f"Power outage ({coordinator.city}, {coordinator.queue})"
+
+  lines = [
+      "BEGIN:VCALENDAR",
+      "VERSION:2.0",
+      "PRODID:-//Power Roulette//Schedule//EN",
+      "CALSCALE:GREGORIAN",
+  ]
+  for start, end in coordinator.intervals:
+    lines.extend(
+        [
+            "BEGIN:VEVENT",
+            f"UID:{entry_id}-{_ical_time(start)}@{DOMAIN}",
+            f"DTSTAMP:{dtstamp}",
+            f"DTSTART:{_ical_time(start)}",
+            f"DTEND:{_ical_time(end)}",
+            f"SUMMARY:{_ical_escape(summary)}",
+            "TRANSP:OPAQUE",
+            "END:VEVENT",
+        ]
+    )
+  lines.append("END:VCALENDAR")
+  return ("\r\n".join(lines) + "\r\n").encode()
+
+
+class PowerRouletteScheduleView(HomeAssistantView):
+  """Serve one entry's normalized schedule as JSON or iCal.
+
+  Consumers share the integration's upstream fetch. Bodies are encoded once per
+  coordinator refresh and carry an ETag, so unchanged polls get ``304 Not Modified``.
+  """
+
+  url = "/api/power_roulette/{entry_id}/schedule"
+  name = "api:power_roulette:schedule"
+
+  def __init__(self, hass: HomeAssistant) -> None:
+    """Initialize the view."""
+    self._hass = hass
+    # (entry_id, format) -> (coordinator data it was built from, etag, body)
+    self._cache: dict[tuple[str, str], tuple[Any, str, bytes]] = {}
+
+  async def get(self, request: web.Request, entry_id: str) -> web.StreamResponse:
+    """Return the schedule for ``entry_id``."""
+    entry_data = self._hass.data.get(DOMAIN, {}).get(entry_id)
+    coordinator = entry_data.get("coordinator") if entry_data else None
+    if not isinstance(coordinator, PowerRouletteCoordinator):
+      for fmt in ("json", "ics"):
+        self._cache.pop((entry_id, fmt), None)
+      return self.json_message("Unknown Power Roulette entry", HTTPStatus.NOT_FOUND)
+
+    fmt = request.query.get("format")
+    if fmt is None:
+      fmt = "ics" if CONTENT_TYPE_ICAL in request.headers.get("Accept", "") else "json"
+    if fmt not in ("json", "ics"):
+      return self.json_message("Unsupported format; use json or ics", HTTPStatus.BAD_REQUEST)
+
+    cached = self._cache.get((entry_id, fmt))
+    if cached and cached[0] is coordinator.data:
+      _, etag, body = cached
+    else:
+      body = _schedule_json(coordinator) if fmt == "json" else _schedule_ical(entry_id, coordinator)
+      etag = f'"{sha1(body).hexdigest()[:20]}"'
+      self._cache[(entry_id, fmt)] = (coordinator.data, etag, body)
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("If-None-Match", "")
+    if if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(",")):
+      return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+    content_type = CONTENT_TYPE_JSON if fmt == "json" else CONTENT_TYPE_ICAL
+    return web.Response(body=body, content_type=content_type, charset="utf-8", headers=headers)